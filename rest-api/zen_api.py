@@ -5,7 +5,8 @@ import os
 import zen_path_info as pi
 import zen_request_context as rc
 import zen_request_validator as rv
-from flask import Flask, abort, request, jsonify
+import zen_response_serializer as rs
+from flask import Flask, abort, request, Response
 
 def check_for_parameters(text):
 	"""
@@ -39,6 +40,18 @@ def initial_checks(version, meta):
 def create_error_output(val):
 	return {val[0]:val[1]}
 
+def create_static_error_output(val):
+	"""
+	For errors whose message never varies, so the output only needs to be encoded once
+	"""
+	return rs.cached_result(('error', val), lambda: create_error_output(val))
+
+def json_response(result):
+	"""
+	Serializes the result into a JSON response
+	"""
+	return Response(rs.encode(result), mimetype='application/json')
+
 def exec_request_pipeline(version, meta, request, varargs = None):
 	"""
 	Standard pipeline for all requests
@@ -65,15 +78,15 @@ app = Flask(__name__)
 
 @app.route('/<version>/<meta>/<path:varargs>')
 def routing_start(version, meta, varargs = None):
-	return jsonify(exec_request_pipeline(version, meta, request, varargs))
+	return json_response(exec_request_pipeline(version, meta, request, varargs))
 
 @app.route('/')
 @app.route('/<path:varargs>')
 def bad_routing_start(varargs = None):
 	if not varargs:
-		return jsonify(create_error_output((404, 'Incomplete URL provided "{}"'.format(varargs))))
+		return json_response(create_static_error_output((404, 'Incomplete URL provided "{}"'.format(varargs))))
 	else:
-		return jsonify(create_error_output((404, 'Incomplete URL provided')))
+		return json_response(create_static_error_output((404, 'Incomplete URL provided')))
 
 if __name__ == "__main__":
     app.run(debug=True)
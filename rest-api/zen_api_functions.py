@@ -1,4 +1,5 @@
 import zen_path_data as pd
+import zen_response_serializer as rs
 
 def _to_lower(value):
 	"""
@@ -61,6 +62,7 @@ def _build_context(element, parameter_set, base_context=None):
 def _exec_noop(request_context):
 	return {}
 
+@rs.model_versioned(lambda request_context: (request_context.version, request_context.meta_type))
 def _return_namespaces(request_context):
 	ret_vals = dict()
 	for namespace_name, namespace_meta_map in pd.NAMESPACE_DATA.items():
@@ -70,6 +72,7 @@ def _return_namespaces(request_context):
 			ret_vals[namespace_name] = meta_specific_map[pd.DESCRIPTION]
 	return ret_vals
 
+@rs.model_versioned(lambda request_context: request_context.version)
 def _return_context_parameters(request_context):
 	"""
 	Returns the context parameters available for the version
@@ -27,6 +27,22 @@ NAMESPACE = 'namespace'
 
 CONTEXT_AS_OF = 'as_of'
 
+_model_version = 0
+
+def get_model_version():
+	"""
+	Returns the current version of the model data held below
+	"""
+	return _model_version
+
+def increment_model_version():
+	"""
+	Must be called whenever the model data changes, so that results derived from it are refreshed
+	"""
+	global _model_version
+	_model_version += 1
+	return _model_version
+
 def as_of_date_default():
 	return datetime.datetime.utcnow()
 def as_of_user_supplied(date_str):
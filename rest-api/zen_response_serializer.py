@@ -0,0 +1,104 @@
+"""
+Serialization of API results into JSON response bodies.
+
+Results that only change when the model changes are encoded once and held until the
+model version moves on; all other results are encoded on each request by the current encoder.
+"""
+import datetime
+import json
+import zen_path_data as pd
+
+class EncodedResult(object):
+	"""
+	A result that has already been encoded to JSON, so can be returned without re-serialization
+	"""
+	def __init__(self, body):
+		self.body = body
+
+def _encode_default(value):
+	"""
+	Handles the types that json cannot serialize natively
+	"""
+	if isinstance(value, (datetime.datetime, datetime.date)):
+		return value.isoformat()
+	raise TypeError('Cannot serialize value of type "{}"'.format(type(value).__name__))
+
+def _json_encoder(result):
+	"""
+	Default encoder - compact output, no key sorting or indentation
+	"""
+	return json.dumps(result, separators=(',', ':'), default=_encode_default)
+
+_encoder = _json_encoder
+_encoded_results = dict()
+
+def set_encoder(encoder_fn=None):
+	"""
+	Replaces the encoder used to serialize results; encoder_fn takes the result and returns
+	the JSON string.  Passing None restores the default encoder.
+	"""
+	global _encoder
+	_encoder = encoder_fn if encoder_fn else _json_encoder
+	# Previously encoded results may not match the output of the new encoder
+	_encoded_results.clear()
+
+def encode(result):
+	"""
+	Returns the JSON string for the result, reusing the encoding if already available
+	"""
+	if isinstance(result, EncodedResult):
+		return result.body
+	return _encoder(result)
+
+def cached_result(key, result_fn):
+	"""
+	Returns the EncodedResult held against the key, only calling result_fn to recreate it
+	if it has not been encoded for the current model version
+	"""
+	model_version = pd.get_model_version()
+	cached = _encoded_results.get(key, None)
+	if not cached or cached[0] != model_version:
+		cached = (model_version, EncodedResult(_encoder(result_fn())))
+		_encoded_results[key] = cached
+	return cached[1]
+
+def model_versioned(key_fn):
+	"""
+	Decorator for executor functions whose result depends only on the model, and on the
+	request context values used by key_fn to build the cache key
+	"""
+	def decorator(exec_fn):
+		def wrapper(request_context):
+			key = (exec_fn.__name__, key_fn(request_context))
+			return cached_result(key, lambda: exec_fn(request_context))
+		wrapper.__name__ = exec_fn.__name__
+		wrapper.__doc__ = exec_fn.__doc__
+		return wrapper
+	return decorator
+
+
+if __name__ == "__main__":
+
+	def run_test(name, passed):
+		if passed:
+			print 'Testing:', name, '- passed'
+		else:
+			print 'Testing:', name, '- failed'
+
+	calls = []
+	def produce():
+		calls.append(1)
+		return {'a': 1}
+
+	# Run some tests
+	run_test('compact encoding', encode({'a': [1, 2]}) == '{"a":[1,2]}')
+	run_test('datetime encoding', encode({'d': datetime.datetime(2014, 1, 2, 3, 4, 5)}) == '{"d":"2014-01-02T03:04:05"}')
+	run_test('encoded passthrough', encode(EncodedResult('{}')) == '{}')
+	first = cached_result('k', produce)
+	run_test('cached once', cached_result('k', produce) is first and len(calls) == 1)
+	pd.increment_model_version()
+	run_test('refreshed on model change', cached_result('k', produce) is not first and len(calls) == 2)
+	set_encoder(lambda result: 'custom')
+	run_test('pluggable encoder', encode({}) == 'custom' and cached_result('k', produce).body == 'custom')
+	set_encoder()
+	run_test('default encoder restored', encode({}) == '{}')